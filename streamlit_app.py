@@ -2,14 +2,12 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
-from datetime import datetime, timedelta
-import json
+import io
 import os
+import time
 
 # 페이지 설정
 st.set_page_config(
@@ -19,29 +17,30 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 폰트 설정
-def set_korean_font():
+# 폰트 설정 (폰트 목록 스캔은 프로세스당 한 번만 수행)
+@st.cache_resource
+def resolve_korean_font():
     try:
         font_path = "/fonts/Pretendard-Bold.ttf"
         if os.path.exists(font_path):
-            plt.rcParams['font.family'] = 'Pretendard'
-            return True
+            return 'Pretendard'
     except:
         pass
     
     try:
         import matplotlib.font_manager as fm
-        font_list = [f.name for f in fm.fontManager.ttflist]
+        font_list = {f.name for f in fm.fontManager.ttflist}
         korean_fonts = ['Malgun Gothic', 'AppleGothic', 'NanumGothic']
         for font in korean_fonts:
             if font in font_list:
-                plt.rcParams['font.family'] = font
-                break
+                return font
     except:
         pass
-    return False
+    return None
 
-set_korean_font()
+korean_font = resolve_korean_font()
+if korean_font:
+    plt.rcParams['font.family'] = korean_font
 plt.rcParams['axes.unicode_minus'] = False
 
 # 사이드바 위젯 정의 (코드 상단으로 이동)
@@ -88,26 +87,38 @@ with st.sidebar:
         
     if st.button("🔄 데이터 다시 시도"):
         st.cache_data.clear()
+        # 공유 OWID 저장소도 비워 다음 실행에서 원본을 새로 내려받도록 함
+        st.session_state['reset_owid_store'] = True
         st.rerun()
 
-# 컬러 테마 및 차트 템플릿 함수
+# 컬러 테마 및 차트 템플릿
+_PALETTES = {
+    "기본": px.colors.qualitative.Set1,
+    "청록색": px.colors.sequential.Teal,
+    "따뜻한 색조": px.colors.sequential.OrRd,
+    "차가운 색조": px.colors.sequential.Blues,
+    "흑백": px.colors.sequential.gray
+}
+
+_TEMPLATES = {
+    "기본": "plotly",
+    "다크": "plotly_dark", 
+    "밝은": "plotly_white"
+}
+
 def get_color_palette(theme):
-    palettes = {
-        "기본": px.colors.qualitative.Set1,
-        "청록색": px.colors.sequential.Teal,
-        "따뜻한 색조": px.colors.sequential.OrRd,
-        "차가운 색조": px.colors.sequential.Blues,
-        "흑백": px.colors.sequential.gray
-    }
-    return palettes.get(theme, px.colors.qualitative.Set1)
+    return _PALETTES.get(theme, _PALETTES["기본"])
 
 def get_chart_template(style):
-    templates = {
-        "기본": "plotly",
-        "다크": "plotly_dark", 
-        "밝은": "plotly_white"
-    }
-    return templates.get(style, "plotly")
+    return _TEMPLATES.get(style, _TEMPLATES["기본"])
+
+# 모든 차트가 공유하는 Plotly 설정 (모드바/로고 제거, 컨테이너 크기에 맞춤)
+_PLOT_CFG = {'displaylogo': False, 'responsive': True, 'displayModeBar': False, 'staticPlot': False}
+
+def show_chart(fig):
+    # 위젯 변경으로 다시 그려져도 사용자의 확대/이동 상태 유지
+    fig.update_layout(uirevision='constant')
+    st.plotly_chart(fig, use_container_width=True, config=_PLOT_CFG)
 
 # 시각화 옵션 변수 설정
 color_palette = get_color_palette(color_theme)
@@ -116,39 +127,91 @@ if show_climate_data and 'chart_style' in locals():
     chart_template = get_chart_template(chart_style)
 
 # 데이터 로딩 함수들
-@st.cache_data(ttl=3600)
+# OWID 데이터에 포함된 대륙/소득그룹 집계 행 (국가별 비교에서 제외)
+_AGG_COUNTRIES = frozenset({
+    'World', 'Asia', 'Europe', 'Africa', 'North America', 'South America',
+    'Oceania', 'High-income countries', 'Low-income countries',
+    'Middle-income countries', 'Upper-middle-income countries'
+})
+
+OWID_CSV_URL = "https://raw.githubusercontent.com/owid/co2-data/master/owid-co2-data.csv"
+OWID_REVALIDATE_SECONDS = 3600
+
+def parse_owid_csv(content):
+    # 필요한 3개 컬럼만 pyarrow 엔진으로 파싱 (전체 ~70개 컬럼 파싱 생략)
+    df = pd.read_csv(io.BytesIO(content), usecols=['country', 'year', 'co2'], engine='pyarrow')
+    co2 = df['co2'].to_numpy(dtype=float)
+    year = df['year'].to_numpy()
+    # 결측/비양수 배출량, 연도 범위, 집계 지역 제외를 하나의 마스크로 계산
+    mask = (
+        np.isfinite(co2) & (co2 > 0) &
+        (year >= 2000) & (year <= 2022) &
+        ~df['country'].isin(_AGG_COUNTRIES).to_numpy()
+    )
+    # 연도/배출량은 int16/float32로 충분 (메모리 및 Plotly 전송량 절반)
+    return pd.DataFrame({
+        'country': df['country'].to_numpy()[mask],
+        'year': year[mask].astype('int16'),
+        'co2_emissions': (co2[mask] * 1000).astype('float32')
+    })
+
+# 세션 간 공유 저장소: 마지막 응답의 ETag/Last-Modified와 파싱된 결과
+@st.cache_resource
+def owid_store():
+    return {'etag': None, 'last_modified': None, 'climate_df': None, 'checked_at': 0.0}
+
+def fetch_owid_climate_data():
+    store = owid_store()
+    if store['climate_df'] is not None and time.time() - store['checked_at'] < OWID_REVALIDATE_SECONDS:
+        return store['climate_df']
+    
+    # 조건부 요청: 원본이 바뀌지 않았으면 304로 다운로드와 파싱을 모두 생략
+    headers = {}
+    if store['climate_df'] is not None:
+        if store['etag']:
+            headers['If-None-Match'] = store['etag']
+        if store['last_modified']:
+            headers['If-Modified-Since'] = store['last_modified']
+    try:
+        response = requests.get(OWID_CSV_URL, headers=headers, timeout=60)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException:
+        # 재검증 실패(타임아웃/5xx 등) 시 이전에 받은 정상 데이터를 그대로 사용
+        if store['climate_df'] is not None:
+            return store['climate_df']
+        raise
+    if response.status_code == 304:
+        store['checked_at'] = time.time()
+        return store['climate_df']
+    
+    climate_df = parse_owid_csv(response.content)
+    store.update(
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+        climate_df=climate_df,
+        checked_at=time.time()
+    )
+    return climate_df
+
+@st.cache_data(ttl=OWID_REVALIDATE_SECONDS)
 def load_climate_data():
     try:
         st.info("🔄 Our World in Data에서 실시간 데이터를 로드 중...")
-        owid_url = "https://raw.githubusercontent.com/owid/co2-data/master/owid-co2-data.csv"
-        df = pd.read_csv(owid_url)
-        if 'country' in df.columns and 'year' in df.columns and 'co2' in df.columns:
-            country_df = df[~df['country'].isin([
-                'World', 'Asia', 'Europe', 'Africa', 'North America', 'South America',
-                'Oceania', 'High-income countries', 'Low-income countries',
-                'Middle-income countries', 'Upper-middle-income countries'
-            ])].copy()
-            climate_df = country_df[['country', 'year', 'co2']].copy()
-            climate_df = climate_df.rename(columns={'co2': 'co2_emissions'})
-            climate_df = climate_df.dropna(subset=['co2_emissions'])
-            climate_df = climate_df[climate_df['co2_emissions'] > 0]
-            climate_df = climate_df[(climate_df['year'] >= 2000) & (climate_df['year'] <= 2022)]
-            climate_df['co2_emissions'] = climate_df['co2_emissions'] * 1000
-            if len(climate_df) > 500:
-                st.success("✅ Our World in Data에서 실시간 CO2 데이터를 성공적으로 로드했습니다!")
-                return climate_df, True
+        climate_df = fetch_owid_climate_data()
+        if len(climate_df) > 500:
+            st.success("✅ Our World in Data에서 실시간 CO2 데이터를 성공적으로 로드했습니다!")
+            return climate_df, True
     except Exception as e:
         st.warning(f"Our World in Data 로드 실패: {str(e)[:100]}...")
     st.warning("⚠️ 실시간 데이터 소스 연결 실패. 고품질 예시 데이터를 사용합니다.")
     return create_sample_climate_data(), False
 
 def create_sample_climate_data():
-    np.random.seed(42)
-    years = list(range(2000, 2023))
+    years = np.arange(2000, 2023)
     countries = ['USA', 'China', 'India', 'Germany', 'Japan', 'South Korea', 
                  'Brazil', 'Canada', 'Russia', 'Australia', 'United Kingdom', 
                  'France', 'Italy', 'Mexico', 'Indonesia']
-    data = []
     base_emissions = {
         'USA': 5000000, 'China': 9000000, 'India': 2200000, 
         'Germany': 750000, 'Japan': 1150000, 'South Korea': 580000,
@@ -156,26 +219,63 @@ def create_sample_climate_data():
         'Australia': 410000, 'United Kingdom': 400000, 'France': 330000,
         'Italy': 320000, 'Mexico': 460000, 'Indonesia': 610000
     }
-    for country in countries:
-        base = base_emissions[country]
-        for year in years:
-            if country in ['China', 'India', 'Indonesia', 'Mexico']:
-                trend = (year - 2000) * 0.025
-            elif country in ['USA', 'Germany', 'Japan', 'United Kingdom', 'France']:
-                trend = -(year - 2000) * 0.015
-            else:
-                trend = (year - 2000) * 0.005
-            covid_effect = -0.1 if year == 2020 else 0
-            noise = np.random.normal(0, 0.03)
-            value = base * (1 + trend + covid_effect + noise)
-            data.append({
-                'country': country,
-                'year': year,
-                'co2_emissions': max(10000, value)
-            })
-    return pd.DataFrame(data)
+    growing = {'China', 'India', 'Indonesia', 'Mexico'}
+    declining = {'USA', 'Germany', 'Japan', 'United Kingdom', 'France'}
+    base = np.array([base_emissions[c] for c in countries], dtype=float)
+    trend_coef = np.array([
+        0.025 if c in growing else -0.015 if c in declining else 0.005
+        for c in countries
+    ])
+    # (국가 수, 연도 수) 행렬로 한 번에 계산
+    trend = trend_coef[:, None] * (years - 2000)[None, :]
+    covid_effect = np.where(years == 2020, -0.1, 0.0)[None, :]
+    noise = np.random.default_rng(42).normal(0, 0.03, size=(len(countries), len(years)))
+    values = base[:, None] * (1 + trend + covid_effect + noise)
+    np.maximum(values, 10000, out=values)
+    return pd.DataFrame({
+        'country': np.repeat(countries, len(years)),
+        'year': np.tile(years, len(countries)).astype('int16'),
+        'co2_emissions': values.ravel().astype('float32')
+    })
 
-@st.cache_data
+# 시계열 다운샘플링 (Largest-Triangle-Three-Buckets)
+MAX_POINTS_PER_TRACE = 500
+
+def lttb_indices(x, y, n_out):
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # 이전 선택점, 다음 버킷 평균점과 이루는 삼각형 넓이가 가장 큰 점 선택
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+def downsample_by_group(df, x, y, by, max_points=MAX_POINTS_PER_TRACE):
+    sizes = df.groupby(by, sort=False).size()
+    if sizes.empty or sizes.max() <= max_points:
+        return df
+    parts = []
+    for _, group in df.groupby(by, sort=False):
+        if len(group) > max_points:
+            group = group.sort_values(x)
+            keep = lttb_indices(group[x].to_numpy(dtype=float), group[y].to_numpy(dtype=float), max_points)
+            group = group.iloc[keep]
+        parts.append(group)
+    return pd.concat(parts)
+
+# 정적 데이터이므로 프로세스당 한 번만 생성하고 모든 세션이 같은 DataFrame을 공유 (읽기 전용)
+@st.cache_resource
 def create_it_job_data():
     job_change_data = {
         '직업 분류': ['사라질 위험 직업'] * 6 + ['새롭게 부상하는 직업'] * 14,
@@ -233,12 +333,72 @@ def create_it_job_data():
         '2030 예상규모 (억달러)': [450, 280, 250, 320, 180],
         '연평균 성장률 (%)': [24, 23, 26, 23, 28]
     }
-    return (pd.DataFrame(job_change_data), pd.DataFrame(skills_data), 
-            pd.DataFrame(energy_trend_data), pd.DataFrame(climate_tech_solutions),
+    job_df = pd.DataFrame(job_change_data).astype({'전망 점수': 'int8'})
+    skills_df = pd.DataFrame(skills_data).astype({'중요도 (%)': 'int8', '성장률 (%)': 'int8'})
+    energy_df = pd.DataFrame(energy_trend_data).astype({
+        '연도': 'int16',
+        '데이터센터 전력소모 (TWh)': 'int16',
+        '전체 IT산업 탄소배출 (%)': 'float32',
+        '친환경 IT 투자 (조원)': 'int16'
+    })
+    return (job_df, skills_df, energy_df, pd.DataFrame(climate_tech_solutions),
             pd.DataFrame(it_impact_data))
 
+# 다운로드용 CSV는 한 번만 직렬화해 재사용 (Excel 호환을 위해 BOM 포함 UTF-8 바이트)
+@st.cache_data
+def to_csv_bytes(df):
+    return ('\ufeff' + df.to_csv(index=False)).encode('utf-8')
+
 # 데이터 로드
 job_df, skills_df, energy_trend_df, climate_tech_df, impact_df = create_it_job_data()
+_CAT = job_df['카테고리'].to_numpy()
+_SCORE = job_df['전망 점수'].to_numpy()
+_YEARS = energy_trend_df['연도'].to_numpy()
+
+# 정적 텍스트 (인사이트 섹션): 두 컬럼을 CSS grid로 묶어 한 번의 st.html로 렌더링
+# 기존 st.markdown 텍스트를 대체하는 유일한 원본이므로 내용 수정은 이 HTML에서만 할 것
+# (좁은 화면에서는 st.columns처럼 한 컬럼으로 자동 전환)
+_INSIGHTS_HTML = """
+<div style="display:grid;grid-template-columns:repeat(auto-fit,minmax(280px,1fr));gap:1rem">
+<div>
+<p><strong>🌍 기후위기가 IT산업에 미치는 영향</strong></p>
+<ul>
+<li><strong>에너지 소비 급증</strong>: 데이터센터, 클라우드, AI 인프라 확대</li>
+<li><strong>탄소배출 증가</strong>: IT분야 온실가스 배출 2-4% 차지</li>
+<li><strong>전자폐기물 문제</strong>: 짧은 제품 수명주기로 환경 문제 심화</li>
+<li><strong>공급망 불안정</strong>: 기후변화로 인한 원자재 가격 변동</li>
+</ul>
+<p><strong>📊 새로운 규제 환경</strong></p>
+<ul>
+<li>EU RoHS, WEEE, 에코디자인 규제 강화</li>
+<li>ESG 경영과 탄소중립 목표 필수화</li>
+<li>탄소국경세 등 글로벌 규제 확산</li>
+</ul>
+</div>
+<div>
+<p><strong>🚀 IT업계의 대응 전략</strong></p>
+<ul>
+<li><strong>그린 IT 기술</strong>: 저전력 반도체, 효율적 냉각시스템</li>
+<li><strong>신재생에너지</strong>: 데이터센터의 재생에너지 전환</li>
+<li><strong>AI 활용</strong>: 에너지 최적화, 환경 감시, 탄소 관리</li>
+<li><strong>순환경제</strong>: 전자폐기물 재활용 및 수명 연장</li>
+</ul>
+<p><strong>🎯 미래 직업 전망</strong></p>
+<ul>
+<li>기존 비효율 시스템 관련 직업 쇠퇴</li>
+<li>그린IT, ESG, 탄소중립 전문가 급증</li>
+<li>친환경 기술 개발 및 규제 대응 전문가 필요</li>
+</ul>
+</div>
+</div>
+"""
+
+# 2030 IT 생태계 전망 (분야, 2024 점수, 2030 예상 점수, 변화율)
+_FUTURE_TEXT = np.array(['그린IT', '전통 IT', '기후테크', '에너지효율', 'ESG 테크'])
+_FUTURE_X = np.array([70, 85, 60, 55, 50])
+_FUTURE_Y = np.array([95, 65, 90, 85, 80])
+_FUTURE_COLOR = np.array([36, -24, 50, 55, 60])
+_FUTURE_SIZE = np.abs(_FUTURE_COLOR)
 
 # 메인 타이틀
 st.title("🌍 기후위기와 IT직업 변화 종합 대시보드")
@@ -286,62 +446,27 @@ if show_insights:
             help="친환경 데이터센터 시장의 연평균 성장률"
         )
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **🌍 기후위기가 IT산업에 미치는 영향**
-        - **에너지 소비 급증**: 데이터센터, 클라우드, AI 인프라 확대
-        - **탄소배출 증가**: IT분야 온실가스 배출 2-4% 차지
-        - **전자폐기물 문제**: 짧은 제품 수명주기로 환경 문제 심화
-        - **공급망 불안정**: 기후변화로 인한 원자재 가격 변동
-        
-        **📊 새로운 규제 환경**
-        - EU RoHS, WEEE, 에코디자인 규제 강화
-        - ESG 경영과 탄소중립 목표 필수화
-        - 탄소국경세 등 글로벌 규제 확산
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🚀 IT업계의 대응 전략**
-        - **그린 IT 기술**: 저전력 반도체, 효율적 냉각시스템
-        - **신재생에너지**: 데이터센터의 재생에너지 전환
-        - **AI 활용**: 에너지 최적화, 환경 감시, 탄소 관리
-        - **순환경제**: 전자폐기물 재활용 및 수명 연장
-        
-        **🎯 미래 직업 전망**
-        - 기존 비효율 시스템 관련 직업 쇠퇴
-        - 그린IT, ESG, 탄소중립 전문가 급증
-        - 친환경 기술 개발 및 규제 대응 전문가 필요
-        """)
+    st.html(_INSIGHTS_HTML)
     
     st.subheader("🔮 2030년 IT 생태계 전망")
     
-    future_outlook = {
-        '분야': ['그린IT', '전통 IT', '기후테크', '에너지효율', 'ESG 테크'],
-        '2024 점수': [70, 85, 60, 55, 50],
-        '2030 예상 점수': [95, 65, 90, 85, 80],
-        '변화율': [36, -24, 50, 55, 60],
-        '변화율_절댓값': [36, 24, 50, 55, 60]
-    }
-    
-    outlook_df = pd.DataFrame(future_outlook)
-    
-    fig = px.scatter(
-        outlook_df,
-        x='2024 점수',
-        y='2030 예상 점수',
-        size='변화율_절댓값',
-        text='분야',
-        title="IT 분야별 성장 전망 (2024 vs 2030) - PDF 분석 기반",
-        labels={'2024 점수': '2024년 현재 수준', '2030 예상 점수': '2030년 예상 수준'},
-        color='변화율',
-        color_continuous_scale='RdYlGn',
-        size_max=50,
-        height=500,
-        template=chart_template
-    )
+    fig = go.Figure(go.Scattergl(
+        x=_FUTURE_X,
+        y=_FUTURE_Y,
+        mode='markers+text',
+        text=_FUTURE_TEXT,
+        textposition="middle center",
+        marker=dict(
+            size=_FUTURE_SIZE,
+            sizemode='area',
+            sizeref=2 * _FUTURE_SIZE.max() / 50 ** 2,
+            color=_FUTURE_COLOR,
+            colorscale='RdYlGn',
+            showscale=True,
+            colorbar=dict(title='변화율')
+        ),
+        showlegend=False
+    ))
     
     fig.add_trace(go.Scatter(
         x=[0, 100],
@@ -352,33 +477,50 @@ if show_insights:
         showlegend=True
     ))
     
-    fig.update_traces(textposition="middle center")
-    fig.update_layout(font=dict(family="Arial, sans-serif"))
-    st.plotly_chart(fig, use_container_width=True)
+    fig.update_layout(
+        title="IT 분야별 성장 전망 (2024 vs 2030) - PDF 분석 기반",
+        xaxis_title='2024년 현재 수준',
+        yaxis_title='2030년 예상 수준',
+        height=500,
+        template=chart_template,
+        font=dict(family="Arial, sans-serif")
+    )
+    show_chart(fig)
 
 # 기후 데이터 섹션
 if show_climate_data:
     st.markdown("---")
     st.header("🌡️ 전 세계 기후 변화 실시간 데이터")
     
+    if st.session_state.pop('reset_owid_store', False):
+        owid_store.clear()
     climate_df, is_real_data = load_climate_data()
     
-    if not climate_df.empty:
-        filtered_df = climate_df[
-            (climate_df['year'] >= climate_year_range[0]) & 
-            (climate_df['year'] <= climate_year_range[1])
-        ]
+    years = climate_df['year'].to_numpy()
+    year_range_mask = (years >= climate_year_range[0]) & (years <= climate_year_range[1])
+    if not year_range_mask.any():
+        st.info("ℹ️ 선택한 연도 범위에 해당하는 기후 데이터가 없습니다.")
+    else:
+        latest_year = years[year_range_mask].max()
         
-        latest_year = filtered_df['year'].max()
-        top_countries = filtered_df[filtered_df['year'] == latest_year].nlargest(top_countries_n, 'co2_emissions')['country'].tolist()
-        filtered_df = filtered_df[filtered_df['country'].isin(top_countries)]
+        # 최근 연도 상위 배출국은 정렬 대신 argpartition으로 O(N) 선택
+        latest_df = climate_df.loc[years == latest_year, ['country', 'co2_emissions']]
+        emissions = latest_df['co2_emissions'].to_numpy()
+        if len(emissions) > top_countries_n:
+            top_idx = np.argpartition(-emissions, top_countries_n)[:top_countries_n]
+        else:
+            top_idx = np.arange(len(emissions))
+        top_countries = set(latest_df['country'].to_numpy()[top_idx])
+        filtered_df = climate_df[year_range_mask & climate_df['country'].isin(top_countries).to_numpy()]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("📈 연도별 CO2 배출량 추이")
+            # 연도 범위가 넓어져도 국가별 트레이스는 최대 MAX_POINTS_PER_TRACE 포인트만 전송
+            line_df = downsample_by_group(filtered_df, 'year', 'co2_emissions', 'country')
             fig = px.line(
-                filtered_df, 
+                line_df, 
                 x='year', 
                 y='co2_emissions', 
                 color='country',
@@ -386,78 +528,88 @@ if show_climate_data:
                 labels={'year': '연도', 'co2_emissions': 'CO2 배출량 (kt)', 'country': '국가'},
                 template=chart_template,
                 color_discrete_sequence=color_palette,
-                height=chart_height
+                height=chart_height,
+                render_mode='webgl'
             )
             if show_data_labels:
                 fig.update_traces(mode="lines+markers")
             fig.update_layout(font=dict(family="Arial, sans-serif"), legend_title_text="국가")
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
         
         with col2:
             st.subheader("🥧 최근 연도 배출량 비중")
             latest_data = filtered_df[filtered_df['year'] == latest_year]
-            fig = px.pie(
-                latest_data, 
-                values='co2_emissions', 
-                names='country',
+            fig = go.Figure(go.Pie(
+                values=latest_data['co2_emissions'].to_numpy(),
+                labels=latest_data['country'].to_numpy()
+            ))
+            fig.update_layout(
                 title=f"{latest_year}년 CO2 배출량 비중",
                 template=chart_template,
-                color_discrete_sequence=color_palette,
+                piecolorway=color_palette,
                 height=chart_height
             )
             if show_data_labels:
                 fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
 # IT 직업 변화 분석 섹션
 if show_job_analysis:
     st.markdown("---")
     st.header("💼 기후위기와 IT 직업 변화 분석")
     
+    # 공유 DataFrame은 그대로 두고, 필터 조건을 하나의 마스크로 합쳐 한 번만 슬라이스
+    mask = np.ones(len(job_df), dtype=bool)
     if job_category_filter != "전체":
-        job_df = job_df[job_df['카테고리'] == job_category_filter]
-    
+        mask &= (_CAT == job_category_filter)
     if not show_declining_jobs:
-        job_df = job_df[job_df['전망 점수'] > 0]
+        mask &= (_SCORE > 0)
+    job_view = job_df.iloc[np.flatnonzero(mask)]
     
-    filtered_energy_df = energy_trend_df[
-        (energy_trend_df['연도'] >= prediction_years[0]) & 
-        (energy_trend_df['연도'] <= prediction_years[1])
-    ]
+    # 연도 컬럼은 오름차순이므로 이진 탐색으로 구간 슬라이스
+    lo = np.searchsorted(_YEARS, prediction_years[0], side='left')
+    hi = np.searchsorted(_YEARS, prediction_years[1], side='right')
+    filtered_energy_df = energy_trend_df.iloc[lo:hi]
     
     st.subheader("🌡️ 기후위기가 IT산업에 미치는 영향 분석")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.bar(
-            impact_df, x='영향도 점수', y='영향 분야', orientation='h',
-            title="IT산업 분야별 기후위기 영향도", color='시급성',
-            color_continuous_scale='Reds', height=chart_height,
-            template=chart_template, text='영향도 점수'
+        fig = go.Figure(go.Bar(
+            x=impact_df['영향도 점수'].to_numpy(), y=impact_df['영향 분야'].to_numpy(),
+            orientation='h', text=impact_df['영향도 점수'].to_numpy(),
+            marker=dict(
+                color=impact_df['시급성'].to_numpy(), colorscale='Reds',
+                showscale=True, colorbar=dict(title='시급성')
+            )
+        ))
+        fig.update_layout(
+            title="IT산업 분야별 기후위기 영향도", height=chart_height, template=chart_template,
+            xaxis_title='영향도 점수', font=dict(family="Arial, sans-serif"),
+            yaxis={'title': '영향 분야', 'categoryorder':'total ascending'}
         )
-        fig.update_layout(font=dict(family="Arial, sans-serif"), yaxis={'categoryorder':'total ascending'})
         if show_data_labels:
             fig.update_traces(textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         fig = px.scatter(
             impact_df, x='시급성', y='대응 필요도', size='영향도 점수',
             text='영향 분야', title="IT산업 대응 우선순위 매트릭스",
             color='영향도 점수', color_continuous_scale='viridis',
-            height=chart_height, template=chart_template
+            height=chart_height, template=chart_template, render_mode='webgl'
         )
         fig.update_traces(textposition="middle center", textfont_size=9)
         fig.update_layout(showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📊 IT 직업 변화 전망")
         fig = px.bar(
-            job_df, x='전망 점수', y='직업명', color='직업 분류',
+            job_view, x='전망 점수', y='직업명', color='직업 분류',
             orientation='h', title="IT 직업별 미래 전망 점수",
             color_discrete_map={'사라질 위험 직업': '#ff6b6b', '새롭게 부상하는 직업': '#4ecdc4'},
             height=chart_height, template=chart_template
@@ -465,7 +617,7 @@ if show_job_analysis:
         fig.update_layout(font=dict(family="Arial, sans-serif"), yaxis={'categoryorder':'total ascending'})
         if show_data_labels:
             fig.update_traces(texttemplate='%{x}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     with col2:
         st.subheader("🎯 미래 핵심 역량")
@@ -474,17 +626,25 @@ if show_job_analysis:
                 skills_df, x='중요도 (%)', y='성장률 (%)',
                 size=[15] * len(skills_df), text='역량',
                 title="역량별 중요도 vs 성장률", color='성장률 (%)',
-                color_continuous_scale='viridis', height=chart_height, template=chart_template
+                color_continuous_scale='viridis', height=chart_height, template=chart_template,
+                render_mode='webgl'
             )
             fig.update_traces(textposition="middle center")
             fig.update_layout(showlegend=False)
         elif skills_view == "막대 차트":
-            fig = px.bar(
-                skills_df, x='중요도 (%)', y='역량', orientation='h',
-                title="미래 역량별 중요도", color='중요도 (%)',
-                color_continuous_scale='Blues', height=chart_height, template=chart_template
+            fig = go.Figure(go.Bar(
+                x=skills_df['중요도 (%)'].to_numpy(), y=skills_df['역량'].to_numpy(),
+                orientation='h',
+                marker=dict(
+                    color=skills_df['중요도 (%)'].to_numpy(), colorscale='Blues',
+                    showscale=True, colorbar=dict(title='중요도 (%)')
+                )
+            ))
+            fig.update_layout(
+                title="미래 역량별 중요도", height=chart_height, template=chart_template,
+                xaxis_title='중요도 (%)',
+                yaxis={'title': '역량', 'categoryorder':'total ascending'}
             )
-            fig.update_layout(yaxis={'categoryorder':'total ascending'})
         else:
             fig = go.Figure()
             fig.add_trace(go.Scatterpolar(
@@ -496,18 +656,21 @@ if show_job_analysis:
                 showlegend=True, title="미래 역량 레이더 차트",
                 height=chart_height, template=chart_template
             )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
     
     st.subheader("⚡ IT산업 에너지 소비 & 친환경 투자 트렌드")
 
-    fig = make_subplots(rows=1, cols=1, specs=[[{"secondary_y": True}]], subplot_titles=["IT산업 에너지 소비 vs 친환경 투자 (2022-2030)"])
-    fig.add_trace(go.Scatter(x=filtered_energy_df['연도'], y=filtered_energy_df['데이터센터 전력소모 (TWh)'], mode='lines+markers', name='데이터센터 전력소모 (TWh)', line=dict(color='red', width=3), marker=dict(size=8)), secondary_y=False)
-    fig.add_trace(go.Scatter(x=filtered_energy_df['연도'], y=filtered_energy_df['친환경 IT 투자 (조원)'], mode='lines+markers', name='친환경 IT 투자 (조원)', line=dict(color='green', width=3), marker=dict(size=8)), secondary_y=True)
-    fig.update_xaxes(title_text="연도")
-    fig.update_yaxes(title_text="전력소모 (TWh)", secondary_y=False)
-    fig.update_yaxes(title_text="친환경 IT 투자 (조원)", secondary_y=True)
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=filtered_energy_df['연도'], y=filtered_energy_df['데이터센터 전력소모 (TWh)'], mode='lines+markers', name='데이터센터 전력소모 (TWh)', line=dict(color='red', width=3), marker=dict(size=8), yaxis='y'))
+    fig.add_trace(go.Scattergl(x=filtered_energy_df['연도'], y=filtered_energy_df['친환경 IT 투자 (조원)'], mode='lines+markers', name='친환경 IT 투자 (조원)', line=dict(color='green', width=3), marker=dict(size=8), yaxis='y2'))
+    fig.update_layout(
+        xaxis=dict(title="연도"),
+        yaxis=dict(title="전력소모 (TWh)"),
+        yaxis2=dict(title="친환경 IT 투자 (조원)", overlaying='y', side='right'),
+        annotations=[dict(text="IT산업 에너지 소비 vs 친환경 투자 (2022-2030)", x=0.5, y=1.0, xref='paper', yref='paper', xanchor='center', yanchor='bottom', showarrow=False, font=dict(size=16))]
+    )
     fig.update_layout(title="IEA 예측: 2026년까지 데이터센터 전력 소모 2배 증가", font=dict(family="Arial, sans-serif"), hovermode='x unified', template=chart_template, height=500)
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
 
 # 하단 정보
 st.markdown("---")
@@ -538,25 +701,20 @@ with st.sidebar:
     st.markdown("---")
     st.subheader("📋 데이터 다운로드")
     
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        csv1 = job_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button("📥 직업 변화", csv1, "it_job_changes_updated.csv", "text/csv", key="download1")
+    # 직업 변화 CSV는 IT 직업 분석 섹션의 카테고리/사라질 직업 필터를 그대로 따름
+    csv1 = to_csv_bytes(job_view if show_job_analysis else job_df)
+    st.download_button("📥 직업 변화", csv1, "it_job_changes_updated.csv", "text/csv", key="download1")
     
-    with col2:
-        csv2 = skills_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button("📥 핵심 역량", csv2, "future_skills_updated.csv", "text/csv", key="download2")
+    csv2 = to_csv_bytes(skills_df)
+    st.download_button("📥 핵심 역량", csv2, "future_skills_updated.csv", "text/csv", key="download2")
     
-    with col3:
-        csv3 = energy_trend_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button("📥 에너지 트렌드", csv3, "energy_trends.csv", "text/csv", key="download3")
+    csv3 = to_csv_bytes(energy_trend_df)
+    st.download_button("📥 에너지 트렌드", csv3, "energy_trends.csv", "text/csv", key="download3")
     
-    with col4:
-        csv4 = climate_tech_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button("📥 기후테크", csv4, "climate_tech_solutions.csv", "text/csv", key="download4")
+    csv4 = to_csv_bytes(climate_tech_df)
+    st.download_button("📥 기후테크", csv4, "climate_tech_solutions.csv", "text/csv", key="download4")
     
-    with col5:
-        csv5 = impact_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button("📥 영향도", csv5, "it_climate_impact.csv", "text/csv", key="download5")
+    csv5 = to_csv_bytes(impact_df)
+    st.download_button("📥 영향도", csv5, "it_climate_impact.csv", "text/csv", key="download5")
 
 st.subheader("")